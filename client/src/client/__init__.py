@@ -4,8 +4,7 @@ import asyncio
 import logging
 import logging.handlers
 import os
-
-from common.messages_types import AbstractMessage
+import queue
 
 from .websocket_interface import WebsocketInterface
 
@@ -24,18 +23,15 @@ class Client:
 
     def __init__(self, always_vote: str = None) -> None:
         """Construct the client object."""
-        self._setup_logger()
+        self._log_listener = self._setup_logger()
         self.log = logging.getLogger("logger")
         self.log.info("Client is alive.")
-        print("!!!CLIENT IS ALIVE!!!")
 
         # Parsing env variables
         self.server_hostname = os.environ["SERVER_HOSTNAME"]
         self.server_port = os.environ["PORT"]
         self.certpath = os.environ["SELF_SIGNED_CERT_PATH"]
 
-        self.event_loop = asyncio.get_event_loop()
-
         self.websocket_interface = WebsocketInterface(always_vote=always_vote)
 
     def run(self) -> None:
@@ -44,19 +40,20 @@ class Client:
             f"Client connects to "
             f"wss://{self.server_hostname}:{self.server_port}"
         )
-        # Connect to the server and handle incoming (downstream) messages
-        self.event_loop.run_until_complete(
-            asyncio.gather(  # noqa: FKA01
+        # Connect to the server; the websocket interface handles the
+        # upstream and downstream traffic internally
+        try:
+            asyncio.run(
                 self.websocket_interface.connect(
                     url=f"wss://{self.server_hostname}:{self.server_port}",
                     certpath=self.certpath,
-                ),
-                self._handle_downstream_message(),
+                )
             )
-        )
+        finally:
+            self._log_listener.stop()
 
     @staticmethod
-    def _setup_logger() -> None:
+    def _setup_logger() -> logging.handlers.QueueListener:
         """Initialize setup for logger."""
         logger = logging.getLogger("logger")
 
@@ -66,30 +63,21 @@ class Client:
         )
 
         # Create a handler
-        handler = logging.handlers.RotatingFileHandler(
+        file_handler = logging.handlers.RotatingFileHandler(
             filename=os.environ["CLIENT_LOGFILE_PATH"], mode="w"
         )
 
-        # Associate the formatter with the handler...
-        handler.setFormatter(formatter)
-        # ...and the handler with the logger
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-
-    async def _handle_downstream_message(self) -> None:
-        """Handle downstream user messages."""
-        while True:
-            message = await self.websocket_interface.receive_message()
-
-            self.log.debug(
-                f"Received message from server, payload {message.payload}"
-            )
+        # Associate the formatter with the handler
+        file_handler.setFormatter(formatter)
 
-    async def _handle_upstream_message(self, message: AbstractMessage) -> None:
-        """Handle an upstream message."""
-        self.log.debug(
-            f"Sending message of type {message.header.msg_id} "
-            f"with payload {message.payload}"
+        # Log records are only enqueued on the event-loop thread; the
+        # listener does the actual file writes on a background thread
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
         )
+        listener.start()
 
-        await self.websocket_interface.send_message(message)
+        logger.setLevel(logging.INFO)
+        return listener
@@ -1,6 +1,13 @@
 """Client application - for every participant."""
 import argparse
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is a performance optimization, not a requirement; fall
+    # back to the default event loop where it is unavailable
+    uvloop = None
+
 from . import Client
 
 
@@ -23,5 +30,9 @@ if __name__ == "__main__":
     args = __parse_args()
     always_vote = args.always_vote
 
+    # Swap in the libuv-based event loop before any asyncio machinery runs
+    if uvloop is not None:
+        uvloop.install()
+
     client = Client(always_vote=always_vote)
     client.run()
@@ -1,10 +1,32 @@
 """Clientside crytography module."""
-import random
+import hashlib
+import math
+import os
 from typing import Any, Dict, List, Tuple
 
-from Cryptodome.Hash import SHA3_256
+from common.crypto import (
+    CURVE_ORD,
+    CurvePoint,
+    calculate_ballot_mask,
+    mul_g,
+    sum_points,
+)
 
-from common.crypto import CURVE_G, CURVE_ORD, CurvePoint, calculate_ballot_mask
+
+def _rand_scalars(count: int) -> List[int]:
+    """Draw cryptographically secure scalars in [1, CURVE_ORD).
+
+    One os.urandom call covers all scalars, amortizing the getrandom
+    syscall; rejection sampling keeps the distribution uniform.
+    """
+    scalars: List[int] = []
+    while len(scalars) < count:
+        pool = os.urandom(32 * (count - len(scalars)))
+        for offset in range(0, len(pool), 32):
+            candidate = int.from_bytes(pool[offset : offset + 32], "big")
+            if 1 <= candidate < CURVE_ORD:
+                scalars.append(candidate)
+    return scalars
 
 
 class Crypto:
@@ -12,24 +34,29 @@ class Crypto:
 
     def __init__(self) -> None:
         """ """
-        self.secret = random.randrange(1, CURVE_ORD)
+        self.secret = _rand_scalars(1)[0]
+        # Scalar multiplication is the most expensive operation here,
+        # so compute the public key once and reuse it everywhere
+        self.public_key = mul_g(self.secret)
         self.client_id: Any = None
         self.vote: Any = None
         self.ballot_zkp_data: Any = None
 
     def get_public_key(self) -> CurvePoint:
         """Get public key, i.e. g^x, where g is the generator and x is the client's secret."""
-        pub_key = CURVE_G * self.secret
-        return pub_key
+        return self.public_key
 
     def get_schnorr_signature(self, client_id: int) -> Tuple[CurvePoint, int]:
         """Prepare a Schnorr signature that serves as a ZKP for knowing the secret."""
         self.client_id = client_id
-        k = random.randrange(1, CURVE_ORD)
-        r = CURVE_G * k
-        h = SHA3_256.new()
-        h.update(bytes(client_id))
-        e = int(h.hexdigest(), base=16) % CURVE_ORD
+        # The nonce must be fresh per signature: reusing k across two
+        # challenges would leak the secret as (s1-s2)/(e2-e1)
+        k = _rand_scalars(1)[0]
+        r = mul_g(k)
+        # hashlib's sha3 is OpenSSL-backed; the 32-byte big-endian
+        # encoding matches what the server hashes on verification
+        digest = hashlib.sha3_256(client_id.to_bytes(32, "big")).digest()
+        e = int.from_bytes(digest, "big") % CURVE_ORD
         s = (k - self.secret * e) % CURVE_ORD
         return r, s
 
@@ -39,22 +66,23 @@ class Crypto:
         """Mask a vote and return the masked ballot."""
         self.vote = vote
         ballot_mask = calculate_ballot_mask(self.client_id, public_keys)
-        proof = self.get_first_phase_ballot_validity_proof(vote, ballot_mask)
-        return ballot_mask * self.secret + CURVE_G * vote, proof
+        masked_ballot = ballot_mask * self.secret + mul_g(vote)
+        proof = self.get_first_phase_ballot_validity_proof(
+            vote, ballot_mask, masked_ballot
+        )
+        return masked_ballot, proof
 
     def get_first_phase_ballot_validity_proof(
-        self, vote: int, ballot_mask: CurvePoint
+        self, vote: int, ballot_mask: CurvePoint, masked_ballot: CurvePoint
     ) -> Dict[str, CurvePoint]:
         """Prepare a dict of values for the first phase of ballot validity ZKP."""
-        w = random.randrange(1, CURVE_ORD)
-        r = random.randrange(1, CURVE_ORD)
-        d = random.randrange(1, CURVE_ORD)
+        w, r, d = _rand_scalars(3)
         self.ballot_zkp_data = w, r, d
-        x = CURVE_G * self.secret
-        y = ballot_mask * self.secret + CURVE_G * vote
-        a1 = CURVE_G * r + x * d
-        a2 = CURVE_G * w
-        b1 = ballot_mask * r + (y + CURVE_G * ((vote - 1) % CURVE_ORD)) * d
+        x = self.public_key
+        y = masked_ballot
+        a1 = mul_g(r) + x * d
+        a2 = mul_g(w)
+        b1 = ballot_mask * r + (y + mul_g(vote - 1)) * d
         b2 = ballot_mask * w
         proof = {"x": x, "y": y}
         if vote == 1:
@@ -79,8 +107,17 @@ class Crypto:
     def get_tally(self, ballots: List[Tuple[int, int]]) -> int:
         """Count the 'yes' votes."""
         participants_num = len(ballots)
-        total = sum(CurvePoint(ballot) for ballot in ballots)
-        for t in range(participants_num + 1):
-            if total == CURVE_G * t:
-                return t
+        total = sum_points(ballots)
+        # Baby-step/giant-step discrete log over the tally range, i.e.
+        # O(sqrt(N)) group operations instead of O(N)
+        m = math.isqrt(participants_num) + 1
+        baby_steps = {mul_g(j).to_json(): j for j in range(m)}
+        giant_step = mul_g(-m)
+        current = total
+        for i in range(m + 1):
+            j = baby_steps.get(current.to_json())
+            if j is not None:
+                tally = i * m + j
+                return tally if tally <= participants_num else -1
+            current = current + giant_step
         return -1
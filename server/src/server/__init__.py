@@ -24,7 +24,6 @@ class Server:
         self.keypath = os.environ["PRIVATE_KEY_PATH"]
 
         # Prepare resources
-        self.event_loop = asyncio.get_event_loop()
         self.connection_listener = ConnectionListener(
             hostname=self.hostname,
             port=self.port,
@@ -34,7 +33,7 @@ class Server:
 
     def run(self) -> None:
         """Run the connection listener."""
-        self.event_loop.run_until_complete(self.connection_listener.run())
+        asyncio.run(self.connection_listener.run())
 
     @staticmethod
     def _setup_logger() -> None:
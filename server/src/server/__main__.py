@@ -1,7 +1,18 @@
 """Application server."""
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is a performance optimization, not a requirement; fall
+    # back to the default event loop where it is unavailable
+    uvloop = None
+
 from . import Server
 
 if __name__ == "__main__":
+    # Swap in the libuv-based event loop before any asyncio machinery runs
+    if uvloop is not None:
+        uvloop.install()
+
     server = Server()
     server.run()
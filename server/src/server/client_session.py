@@ -1,13 +1,48 @@
 """Class representing a client session with the server."""
 
 import asyncio
-from typing import Optional, Tuple
+import logging
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 import websockets.server as ws
 
+from .session_event import SessionEvent
+
+LOG = logging.getLogger("logger")
+
+# A full protocol round queues a handful of events per session; a
+# backlog this deep means the downstream writer stopped draining
+EVENT_BUFFER_LIMIT = 64
+
 
 class ClientSession:
-    """Class representing a client session with the server."""
+    """Class representing a client session with the server.
+
+    The session's event buffer follows a single-writer-task discipline:
+    producers only ever call put_event (a synchronous append, no task
+    spawn, safe from any coroutine on the loop), and exactly one
+    consumer - the session's downstream handler task started alongside
+    the connection - drains it and owns all socket writes. Broadcasts
+    therefore cost one put_event per recipient rather than a task per
+    message, and the drain-everything get_events lets the writer
+    coalesce a backlog into a single frame.
+    """
+
+    __slots__ = (
+        "_event_buffer",
+        "_event_ready",
+        "connection",
+        "user_id",
+        "hostname",
+        "port",
+        "public_key",
+        "public_key_proof",
+        "masked_ballot",
+        "masked_ballot_proof",
+        "challenge",
+        "ballot_accepted",
+    )
 
     def __init__(
         self,
@@ -17,7 +52,11 @@ class ClientSession:
         public_key_proof: Tuple[int, int],
     ) -> None:
         """Initialize a client session."""
-        self.event_queue: asyncio.Queue = asyncio.Queue()
+        # Single-consumer event buffer: a deque plus one Event is
+        # lighter than asyncio.Queue, which allocates a future per
+        # blocked get and keeps task-accounting state we never use
+        self._event_buffer: Deque[SessionEvent] = deque()
+        self._event_ready = asyncio.Event()
         self.connection = conn
         self.user_id = user_id
         self.hostname = conn.remote_address[0]
@@ -29,3 +68,38 @@ class ClientSession:
         self.masked_ballot_proof = {}
         self.challenge: Optional[int] = None
         self.ballot_accepted = False
+
+    def put_event(self, event: SessionEvent) -> None:
+        """Queue an event for this session's downstream handler.
+
+        The buffer is bounded: a session whose writer no longer drains
+        it is dead or hostile, so overflow is treated as a protocol
+        violation and the connection is closed instead of letting the
+        backlog grow without limit.
+        """
+        if len(self._event_buffer) >= EVENT_BUFFER_LIMIT:
+            LOG.warning(
+                "Event buffer overflow for Client %s - closing connection",
+                self.user_id,
+            )
+            asyncio.ensure_future(
+                self.connection.close(
+                    code=3001, reason="Event backlog overflow"
+                )
+            )
+            return
+        self._event_buffer.append(event)
+        self._event_ready.set()
+
+    async def get_events(self) -> List[SessionEvent]:
+        """Wait for events and drain everything that is queued.
+
+        Returning the whole backlog at once lets the downstream
+        handler cork the resulting messages into a single frame.
+        """
+        while not self._event_buffer:
+            self._event_ready.clear()
+            await self._event_ready.wait()
+        events = list(self._event_buffer)
+        self._event_buffer.clear()
+        return events
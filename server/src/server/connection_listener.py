@@ -12,13 +12,17 @@ import websockets.server as ws
 
 from common.messages_types import (
     SetUserIdMessage,
-    ZKPForPubKeyAccMessage,
     msg_recv,
     msg_send,
+    send_acceptance,
 )
 from .crypto import Crypto
 from .session_manager_server import SessionsManager
 
+# Resolved once at import time: logging.getLogger takes the registry
+# lock on every call, which is wasted work on per-connection paths
+LOG = logging.getLogger("logger")
+
 
 class ServerAuthFailed(Exception):
     """Error thrown on authentication failure."""
@@ -38,71 +42,106 @@ class ConnectionListener:
         self.certpath = certpath
         self.keypath = keypath
         self.session_manager = SessionsManager()
-        self.log = logging.getLogger("logger")
-        self.log.info("Server connection listener is alive")
+        LOG.info("Server connection listener is alive")
         self.logged_users_num = 0
+        # Serve-until-signaled primitive; set via stop() for a graceful
+        # shutdown instead of cancelling a never-completed Future
+        self._stop = asyncio.Event()
 
     async def run(self) -> None:
         """Open a public port and listen for connections."""
-        self.log.info(f"Hostname is {self.hostname}")
+        LOG.info(f"Hostname is {self.hostname}")
 
         ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        # TLS 1.3 gives a 1-RTT handshake with session-ticket resumption
+        # on by default, so repeat clients skip the key exchange; this
+        # matches the floor the client-side context pins. TLS-level
+        # compression stays off alongside the websocket deflate below.
+        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_3
+        ssl_context.options |= ssl.OP_NO_COMPRESSION
         ssl_context.load_cert_chain(
             certfile=self.certpath,
             keyfile=self.keypath,
         )
 
-        self.log.info(
+        LOG.info(
             f"SSL context established. Opening public port: {self.port}..."
         )
 
+        # The protocol messages are small structured envelopes, so
+        # per-message deflate is pure CPU overhead and costs a ~32 KiB
+        # sliding window per connection - disable it, as the client does
         async with ws.serve(
             ws_handler=self.__handle_connection,
             host=self.hostname,
             port=self.port,
             ssl=ssl_context,
+            compression=None,
         ):
-            await asyncio.Future()
+            await self._stop.wait()
+
+    def stop(self) -> None:
+        """Signal the listener to leave the serve loop."""
+        self._stop.set()
 
     async def __handle_connection(
         self, conn: ws.WebSocketServerProtocol
     ) -> None:
         """Handle a new incoming connection."""
-        self.log.info(
-            f"Accepted connection from {conn.remote_address[0]}:"
-            f"{conn.remote_address[1]}"
+        LOG.info(
+            "Accepted connection from %s:%s",
+            conn.remote_address[0],
+            conn.remote_address[1],
         )
 
         # log in the User
         try:
             user_login_message = await msg_recv(conn)
             public_key = user_login_message.payload["public_key"]
-            self.log.info(
-                f"Server received message from Client with {public_key=}."
+            # %-style args defer formatting the big-integer coordinates
+            # until the record is actually emitted
+            LOG.info(
+                "Server received message from Client with public_key=%s.",
+                public_key,
             )
             user_id = self.logged_users_num
             self.logged_users_num += 1
 
             set_user_id_message = SetUserIdMessage(user_id=user_id)
             await msg_send(set_user_id_message, conn)
-            self.log.info(f"Server sent {user_id=} to Client.")
+            LOG.info("Server sent user_id=%s to Client.", user_id)
 
             zkp_for_pubkey_message = await msg_recv(conn)
             signature = zkp_for_pubkey_message.payload["signature"]
             exponent = zkp_for_pubkey_message.payload["exponent"]
-            self.log.info(
-                f"Server received {signature=} {exponent=} "
-                f"for public key from client {user_id}."
+            LOG.info(
+                "Server received signature=%s exponent=%s "
+                "for public key from client %s.",
+                signature,
+                exponent,
+                user_id,
             )
 
-            acceptance = Crypto.verify_schnorr_signature(user_id, signature, exponent, public_key)
-            acceptance_message = ZKPForPubKeyAccMessage(acceptance=acceptance)
-            await msg_send(acceptance_message, conn)
-            self.log.info(
-                f"Server sent {acceptance=} for ZKP for public key "
-                f"to Client {user_id}."
+            # Verification is CPU-bound point arithmetic; push it off
+            # the event loop so concurrent handshakes keep progressing
+            loop = asyncio.get_running_loop()
+            acceptance = await loop.run_in_executor(
+                None,
+                Crypto.verify_schnorr_signature,
+                user_id,
+                signature,
+                exponent,
+                public_key,
+            )
+            # Both acceptance frames are constant; send the cached bytes
+            await send_acceptance(conn, acceptance)
+            LOG.info(
+                "Server sent acceptance=%s for ZKP for public key "
+                "to Client %s.",
+                acceptance,
+                user_id,
             )
-            self.log.info(f"Successfully logged in Client {user_id}.")
+            LOG.info("Successfully logged in Client %s.", user_id)
             await self.session_manager.add_session_with_user(
                 conn=conn,
                 user_id=str(user_id),
@@ -111,11 +150,12 @@ class ConnectionListener:
             )
 
         except ServerAuthFailed:
-            self.log.error(
-                f"User authentication failed: "
-                f"{conn.remote_address[0]}:{conn.remote_address[1]}"
+            LOG.error(
+                "User authentication failed: %s:%s",
+                conn.remote_address[0],
+                conn.remote_address[1],
             )
             # Terminate the connection with application error code
             await conn.close(code=3000, reason="Authentication failed")
         except Exception:
-            self.log.error("Unexpected error occurred!", exc_info=True)
+            LOG.error("Unexpected error occurred!", exc_info=True)
@@ -1,10 +1,36 @@
 """Serverside crytography module."""
-import random
+import hashlib
+import secrets
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
-from Cryptodome.Hash import SHA3_256
+from common.crypto import (
+    CURVE_ORD,
+    CurvePoint,
+    batch_verify_schnorr,
+    calculate_ballot_mask,
+    curve_point_from_xy,
+    mul_g,
+)
 
-from common.crypto import CURVE_G, CURVE_ORD, CurvePoint, calculate_ballot_mask
+
+@lru_cache(maxsize=4096)
+def _cached_ballot_mask(
+    client_id: int, public_keys: Tuple[Tuple[int, int], ...]
+) -> CurvePoint:
+    """Memoized ballot mask for a voter.
+
+    The key set is fixed for a voting round, so after the first ZKP
+    verification every repeat lookup for the same voter skips the
+    prefix-sum combination entirely.
+    """
+    return calculate_ballot_mask(client_id, list(public_keys))
+
+
+# mul_g(-1) reduces to a near-full-length scalar multiplication; the
+# "no" side of the ballot proof needs -G on every verification, so
+# negate the generator once at import time instead
+_NEG_G = -mul_g(1)
 
 
 class Crypto:
@@ -21,17 +47,59 @@ class Crypto:
         Check if the client's Schnorr signature is valid,
         i.e. if the ZKP for the first phase passed.
         """
-        h = SHA3_256.new()
-        h.update(bytes(client_id))
-        e = int(h.hexdigest(), base=16) % CURVE_ORD
-        signature = CurvePoint(signature)
-        public_key = CurvePoint(public_key)
-        return signature == CURVE_G * exponent + public_key * e
+        # hashlib's sha3 is OpenSSL-backed and noticeably faster than
+        # the Cryptodome implementation; the digest is identical. The
+        # fixed 32-byte big-endian encoding matches what clients sign.
+        digest = hashlib.sha3_256(client_id.to_bytes(32, "big")).digest()
+        e = int.from_bytes(digest, "big") % CURVE_ORD
+        # CurvePoint validates the on-curve equation on construction -
+        # a single field-level check - so junk coordinates are rejected
+        # here without paying for the scalar multiplications below
+        try:
+            signature = CurvePoint(signature)
+            public_key = CurvePoint(public_key)
+        except (ValueError, TypeError, IndexError):
+            return False
+        return signature == mul_g(exponent) + public_key * e
+
+    @staticmethod
+    def verify_schnorr_signatures_batch(
+        items: List[Tuple[int, Tuple[int, int], int, Tuple[int, int]]],
+    ) -> bool:
+        """Verify several login signatures with one combined equation.
+
+        Takes (client_id, signature, exponent, public_key) tuples and
+        delegates to the common-layer random-linear-combination check,
+        so N verifications cost one multi-scalar equation instead of
+        2N scalar multiplications. Single-item batches fall back to
+        the plain check inside the common helper.
+        """
+        signatures = []
+        exponents = []
+        public_keys = []
+        challenges = []
+        for client_id, signature, exponent, public_key in items:
+            digest = hashlib.sha3_256(
+                client_id.to_bytes(32, "big")
+            ).digest()
+            signatures.append(signature)
+            exponents.append(exponent)
+            public_keys.append(public_key)
+            challenges.append(int.from_bytes(digest, "big") % CURVE_ORD)
+        try:
+            return batch_verify_schnorr(
+                signatures, exponents, public_keys, challenges
+            )
+        except (ValueError, TypeError, IndexError):
+            return False
 
     @staticmethod
     def get_zkp_challenge() -> int:
         """Get a random challenge value for the ballot validity ZKP."""
-        return random.randrange(1, CURVE_ORD)
+        # secrets draws straight from os.urandom - appropriate for a
+        # verifier-issued challenge and cheaper than random's Mersenne
+        # Twister plus range rejection on a 256-bit bound
+        return 1 + secrets.randbelow(CURVE_ORD - 1)
 
     @staticmethod
     def verify_ballot_zkp(
@@ -41,22 +109,37 @@ class Crypto:
         proof: Dict[str, Any],
     ) -> bool:
         """Validate a ballot."""
-        x = CurvePoint(proof["x"])
-        y = CurvePoint(proof["y"])
-        a1 = CurvePoint(proof["a1"])
-        a2 = CurvePoint(proof["a2"])
-        b1 = CurvePoint(proof["b1"])
-        b2 = CurvePoint(proof["b2"])
         d1 = proof["d1"]
         d2 = proof["d2"]
+        # Cheap integer check first: a bad challenge split rejects the
+        # proof before any point deserialization or scalar multiplication
+        if challenge != (d1 + d2) % CURVE_ORD:
+            return False
+
+        # x is the voter's public key and y their masked ballot - both
+        # recur across server paths, so take them from the shared
+        # pre-validated point cache. The a/b commitments are fresh
+        # randomness per proof and would only churn the cache.
+        x = curve_point_from_xy(*proof["x"])
+        y = curve_point_from_xy(*proof["y"])
         r1 = proof["r1"]
         r2 = proof["r2"]
-        ballot_mask = calculate_ballot_mask(int(client_id), public_keys)
-
-        return (
-            challenge == (d1 + d2) % CURVE_ORD
-            and a1 == CURVE_G * r1 + x * d1
-            and b1 == ballot_mask * r1 + y * d1
-            and a2 == CURVE_G * r2 + x * d2
-            and b2 == ballot_mask * r2 + (y + CURVE_G * (-1 % CURVE_ORD)) * d2
+
+        # Each remaining condition costs a handful of scalar mults, so
+        # fail fast between them instead of building one big expression
+        if CurvePoint(proof["a1"]) != mul_g(r1) + x * d1:
+            return False
+        if CurvePoint(proof["a2"]) != mul_g(r2) + x * d2:
+            return False
+
+        # The mask is the most expensive term (O(n) in voters), so it is
+        # only computed once the x-side checks have passed
+        ballot_mask = _cached_ballot_mask(
+            int(client_id),
+            tuple((int(key[0]), int(key[1])) for key in public_keys),
         )
+        if CurvePoint(proof["b1"]) != ballot_mask * r1 + y * d1:
+            return False
+        return CurvePoint(proof["b2"]) == ballot_mask * r2 + (
+            y + _NEG_G
+        ) * d2
@@ -4,11 +4,14 @@ import logging
 from typing import Any, Dict
 
 from common.messages_types import (
+    AbstractMessage,
     FinalBallotsMessage,
     SendQuestionMessage,
     ZKPForBallotAccMessage,
     ZKPForBallotChallengeMessage,
-    msg_send,
+    msg_send_batch,
+    msg_serialize,
+    send_serialized,
 )
 from server.client_session import ClientSession
 
@@ -41,6 +44,14 @@ class SessionDownstreamHandler:
             # fmt: on
             EventType.SEND_BALLOTS: self.__handle_event_send_ballots,
         }
+        # EventType values are small contiguous ints, so a list indexed
+        # by the raw value dispatches without hashing
+        self._handler_table: list = [None] * (max(self.event_handlers) + 1)
+        for event_type, handler in self.event_handlers.items():
+            self._handler_table[event_type] = handler
+        # Last (payload, frame) pair sent: fan-out events share one
+        # payload across sessions, so the frame is encoded only once
+        self._fanout_frame: Any = None
 
     async def handle_downstream(self, session: ClientSession) -> None:
         """Handle downstream traffic, i.e. server to client.
@@ -48,14 +59,49 @@ class SessionDownstreamHandler:
         This API is exposed to the session manager so that it
         can dispatch downstream handling here.
         """
+        # Bind the per-iteration lookups once; LOAD_FAST beats repeated
+        # attribute resolution in this long-lived loop
+        get_events = session.get_events
+        handler_table = self._handler_table
+        table_size = len(handler_table)
+        log_warning = self.log.warning
+        connection = session.connection
+
         while True:
-            event: SessionEvent = await self.__get_event(session)
-            if event.event_type in self.event_handlers.keys():
-                # Call a registered event handler
-                # await self.event_handlers[event.event_type](event, session)
-                await self.event_handlers[event.event_type](event, session)
-            else:
-                self.log.warning(f"Unsupported event type: {event.event_type}")
+            # The session buffer hands over its whole backlog so the
+            # resulting messages can be corked into a single frame
+            events = await get_events()
+
+            messages = []
+            for event in events:
+                event_type = event.event_type
+                handler = (
+                    handler_table[event_type]
+                    if 0 <= event_type < table_size
+                    else None
+                )
+                if handler is not None:
+                    # Build (and log) the downstream message
+                    messages.append(handler(event, session))
+                else:
+                    log_warning(
+                        "Unsupported event type: %s", event.event_type
+                    )
+
+            # Single-send fast path avoids the batching overhead for
+            # the common one-event case; identical fan-out payloads
+            # (question, final ballots) reuse the cached frame
+            if len(messages) == 1:
+                payload = events[0].payload
+                cached = self._fanout_frame
+                if cached is not None and cached[0] is payload:
+                    frame = cached[1]
+                else:
+                    frame = msg_serialize(messages[0])
+                    self._fanout_frame = (payload, frame)
+                await send_serialized(frame, connection)
+            elif messages:
+                await msg_send_batch(messages, connection)
 
     async def send_event(self, event: SessionEvent, user_id: str) -> None:
         """Send an event.
@@ -64,68 +110,64 @@ class SessionDownstreamHandler:
         downstream handler.
         """
         session = self.sessions[user_id]
-        await session.event_queue.put(event)
-
-    async def __get_event(self, session: ClientSession) -> SessionEvent:
-        """Receive an event from the session's event queue."""
-        return await session.event_queue.get()
+        session.put_event(event)
 
-    async def __handle_event_send_question(
+    def __handle_event_send_question(
         self, event: SessionEvent, session: ClientSession
-    ) -> None:
+    ) -> AbstractMessage:
         """Handle session event of type SEND_QUESTION."""
         assert isinstance(event.payload, dict)
         payload: Dict[str, Any] = event.payload
         the_question = payload["the_question"]
         public_keys = payload["public_keys"]
 
-        # Wrap the event in a AbstractMessage and send downstream to the client
-        message = SendQuestionMessage(
-            the_question=the_question, public_keys=public_keys
-        )
-        await msg_send(message, session.connection)
         self.log.info(
-            f"Server sent {the_question=} to Client {session.user_id}."
+            "Server sends the_question=%s to Client %s.",
+            the_question,
+            session.user_id,
+        )
+        # Wrap the event in a AbstractMessage bound for the client
+        return SendQuestionMessage(
+            the_question=the_question, public_keys=public_keys
         )
 
-    async def __handle_event_zkp_for_ballot_challenge(
+    def __handle_event_zkp_for_ballot_challenge(
         self, event: SessionEvent, session: ClientSession
-    ) -> None:
+    ) -> AbstractMessage:
         """Handle session event of type ZKP_FOR_BALLOT_CHALLENGE."""
         assert isinstance(event.payload, dict)
         challenge = event.payload["challenge"]
-        message = ZKPForBallotChallengeMessage(challenge=challenge)
-        await msg_send(message, session.connection)
         self.log.info(
-            f"Server sent {challenge=} for ZKP for Ballot to "
-            f"Client {session.user_id}."
+            "Server sends challenge=%s for ZKP for Ballot to Client %s.",
+            challenge,
+            session.user_id,
         )
+        return ZKPForBallotChallengeMessage(challenge=challenge)
 
-    async def __handle_event_zkp_for_ballot_acc(
+    def __handle_event_zkp_for_ballot_acc(
         self, event: SessionEvent, session: ClientSession
-    ) -> None:
+    ) -> AbstractMessage:
         """Handle session event of type ZKP_FOR_BALLOT_ACC."""
         assert isinstance(event.payload, dict)
         payload: Dict[str, Any] = event.payload
         acceptance = payload["acceptance"]
 
-        # Wrap the event in a AbstractMessage and send downstream to the client
-        message = ZKPForBallotAccMessage(acceptance=acceptance)
-        await msg_send(message, session.connection)
         self.log.info(
-            f"Server sent {acceptance=} for ZKP for Ballot to "
-            f"Client {session.user_id}."
+            "Server sends acceptance=%s for ZKP for Ballot to Client %s.",
+            acceptance,
+            session.user_id,
         )
+        return ZKPForBallotAccMessage(acceptance=acceptance)
 
-    async def __handle_event_send_ballots(
+    def __handle_event_send_ballots(
         self, event: SessionEvent, session: ClientSession
-    ) -> None:
+    ) -> AbstractMessage:
         """Handle session event of type SEND_BALLOTS."""
         assert isinstance(event.payload, dict)
         payload: Dict[str, Any] = event.payload
         ballots = payload["ballots"]
 
-        # Wrap the event in a AbstractMessage and send downstream to the client
-        message = FinalBallotsMessage(ballots=ballots)
-        await msg_send(message, session.connection)
-        self.log.info(f"Server sent {ballots=} to Client {session.user_id}.")
+        self.log.info(
+            "Server sends ballots=%s to Client %s.", ballots, session.user_id
+        )
+        return FinalBallotsMessage(ballots=ballots)
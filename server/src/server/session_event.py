@@ -17,6 +17,10 @@ class EventType(IntEnum):
 class SessionEvent:
     """A session event."""
 
+    # Events are allocated on the per-session hot path; slots drop the
+    # per-instance dict and make the attribute reads fixed offsets
+    __slots__ = ("event_type", "payload")
+
     def __init__(
         self,
         event_type: EventType,
@@ -30,6 +34,8 @@ class SessionEvent:
 class SendQuestionEvent(SessionEvent):
     """Send question event."""
 
+    __slots__ = ()
+
     def __init__(self, payload: Dict[str, Any]) -> None:
         """Initialize send question message event."""
         super().__init__(EventType.SEND_QUESTION, payload)
@@ -38,6 +44,8 @@ class SendQuestionEvent(SessionEvent):
 class ZKPForBallotChallengeEvent(SessionEvent):
     """Challenge of ZKP for ballot event."""
 
+    __slots__ = ()
+
     def __init__(self, payload: Dict[str, Any]) -> None:
         """Initialize challenge of ZKP for ballot event."""
         super().__init__(EventType.ZKP_FOR_BALLOT_CHALLENGE, payload)
@@ -46,6 +54,8 @@ class ZKPForBallotChallengeEvent(SessionEvent):
 class ZKPForBallotAccEvent(SessionEvent):
     """Acceptance of ZKP for ballot event."""
 
+    __slots__ = ()
+
     def __init__(self, payload: Dict[str, Any]) -> None:
         """Initialize acceptance of ZKP for ballot event."""
         super().__init__(EventType.ZKP_FOR_BALLOT_ACC, payload)
@@ -54,6 +64,8 @@ class ZKPForBallotAccEvent(SessionEvent):
 class SendBallotsEvent(SessionEvent):
     """Send masked ballots event."""
 
+    __slots__ = ()
+
     def __init__(self, payload: Dict[str, Any]) -> None:
         """Initialize send ballots event."""
         super().__init__(EventType.SEND_BALLOTS, payload)
@@ -3,7 +3,6 @@
 import asyncio
 import logging
 import os
-from asyncio import Event
 from typing import Any, Dict, Tuple
 
 from websockets.exceptions import ConnectionClosed
@@ -16,6 +15,10 @@ from server.session_upstream_handler import SessionUpstreamHandler
 from .client_session import ClientSession
 from .session_event import SendQuestionEvent
 
+# Read once at import time: skips the environment lookup on every
+# manager construction and fails fast when the variable is missing
+THE_QUESTION = os.environ["THE_QUESTION"]
+
 
 class SessionsManager:
     """Server session manager.
@@ -31,7 +34,10 @@ class SessionsManager:
         self.log = logging.getLogger("logger")
         self.sessions: Dict[str, ClientSession] = {}
         self.transcripts: Dict[str, Dict[str, Any]] = {}
-        self.the_question = os.environ["THE_QUESTION"]
+        self.the_question = THE_QUESTION
+        # Set exactly once, when the last participant joins; waiters
+        # block on it directly instead of polling the session count
+        self.all_joined = asyncio.Event()
         # Instantiate the traffic handlers
         self.downstream_handler = SessionDownstreamHandler(
             sessions=self.sessions,
@@ -57,8 +63,16 @@ class SessionsManager:
             public_key_proof=public_key_proof,
         )
         self.sessions[user_id] = session
-
-        await self.__wait_for_everybody_next_send_question(user_id)
+        if len(self.sessions) >= NUM_PARTICIPANTS:
+            # The last joiner builds the question once and fans it out
+            # to every session before releasing the waiters
+            self.__broadcast_question()
+            self.all_joined.set()
+        else:
+            self.log.info(
+                "Server waits for everybody before sending the question."
+            )
+        await self.all_joined.wait()
 
         try:
             # Use fork-join semantics to run both upstream and
@@ -71,34 +85,31 @@ class SessionsManager:
         except ConnectionClosed as e:
             await self.__handle_connection_closed(user_id, e)
 
-    async def __check_sessions_count(self, flag: Event) -> None:
-        while True:
-            await asyncio.sleep(0.1)
-            if len(self.sessions) >= NUM_PARTICIPANTS:
-                flag.set()
-                return
-
-    async def __wait_for_everybody_next_send_question(
-        self, user_id: str
-    ) -> None:
-        self.log.info(
-            "Server waits for everybody before sending the question."
+    def __broadcast_question(self) -> None:
+        """Fan the question out to every joined session.
+
+        Runs exactly once, from the coroutine that completed the
+        participant count. The event instance is shared, so the
+        downstream handlers reuse one serialized frame for every
+        recipient.
+        """
+        # Order by user id: clients index this list with their user id
+        # when computing the ballot mask, and dict insertion order is
+        # not guaranteed to match login order
+        public_keys = tuple(
+            self.sessions[user_id].public_key
+            for user_id in sorted(self.sessions, key=int)
         )
-        flag = asyncio.Event()
-        asyncio.create_task(self.__check_sessions_count(flag))
-        await flag.wait()
 
         send_question_event = SendQuestionEvent(
             payload={
                 "the_question": self.the_question,
-                "public_keys": [
-                    session.public_key for session in self.sessions.values()
-                ],
+                "public_keys": public_keys,
             }
         )
-
-        self.log.info(f"Servers sends question to {user_id}.")
-        await self.downstream_handler.send_event(send_question_event, user_id)
+        self.log.info("Server sends question to all Clients.")
+        for session in self.sessions.values():
+            session.put_event(send_question_event)
 
     async def __handle_connection_closed(
         self, user_id: str, exception: ConnectionClosed
@@ -1,9 +1,10 @@
 """Upstream traffic handler."""
 import asyncio
 import logging
-from asyncio import Event
 from typing import Dict
 
+from websockets.exceptions import ConnectionClosed
+
 from common import NUM_PARTICIPANTS
 from common.messages_types import AbstractMessage, MsgId, msg_recv
 from server.client_session import ClientSession
@@ -36,6 +37,14 @@ class SessionUpstreamHandler:
             MsgId.MASKED_BALLOT: self._steer_message_masked_ballot,
             MsgId.BALLOT_ZKP: self._steer_message_ballot_zkp,
         }
+        # Counters maintained at the mutation sites replace the old
+        # 10 Hz scans over the session dict; the last accepted ballot
+        # triggers the broadcast directly
+        self._ballots_in = 0
+        self._ballots_accepted = 0
+        # The key set is immutable once voting starts; built lazily on
+        # the first ZKP verification, reused for every later one
+        self._public_keys_snapshot = None
 
     async def handle_upstream(self, session: ClientSession) -> None:
         """Handle upstream traffic, i.e. client to server.
@@ -43,51 +52,58 @@ class SessionUpstreamHandler:
         This API is exposed to the session manager so that it
         can dispatch upstream handling here.
         """
+        # Bind the per-iteration lookups once; LOAD_FAST beats repeated
+        # attribute resolution in this long-lived loop
+        recv = msg_recv
+        resolve_handler = self.message_handlers.get
+        log_warning = self.log.warning
+        connection = session.connection
+
         while True:
-            # Receive a message from the socket
-            message = await msg_recv(session.connection)
-
-            msg_id = message.header.msg_id
-
-            # Validate the message header
-            if msg_id in self.message_handlers.keys():
-                # Call the relevant handler
-                await self.message_handlers[msg_id](message, session)
-            else:
-                self.log.warning(
-                    "Received malformed message from"
-                    + f" Client {session.user_id}:"
-                    + f" {message.header.msg_id=},"
+            try:
+                # Receive a message from the socket
+                message = await recv(connection)
+
+                # Single dict probe validates the header and resolves
+                # the handler in one go
+                handler = resolve_handler(message.header.msg_id)
+                if handler is not None:
+                    await handler(message, session)
+                else:
+                    log_warning(
+                        "Received malformed message from Client %s:"
+                        " msg_id=%s,",
+                        session.user_id,
+                        message.header.msg_id,
+                    )
+            except ConnectionClosed:
+                # Genuine disconnect - let the session manager clean up
+                raise
+            except Exception:
+                # One bad message must not tear down the session and
+                # force the client through re-auth and the join barrier
+                self.log.exception(
+                    "Error handling upstream message from Client %s",
+                    session.user_id,
                 )
 
-    async def __check_ballot_count(self, flag: Event) -> None:
-        while True:
-            await asyncio.sleep(0.1)
-            ballots = [
-                session.masked_ballot for session in self.sessions.values()
-            ]
-            ballot_count = sum(ballot is not None for ballot in ballots)
-
-            if ballot_count >= NUM_PARTICIPANTS and all(
-                session.ballot_accepted for session in self.sessions.values()
-            ):
-                flag.set()
-                return
+    def __broadcast_ballots(self) -> None:
+        """Fan the final ballot list out to every session.
 
-    async def __wait_for_everybody_vote_next_send_all_ballots(
-        self, session: ClientSession
-    ) -> None:
-        self.log.info(
-            f"Server starts waiting for all ballots in session "
-            f"with Client {session.user_id}."
+        Runs once, from the coroutine that accepted the last ballot.
+        The list is built a single time and the event instance is
+        shared, so the downstream handlers reuse one serialized frame
+        for every recipient.
+        """
+        self.log.info("Server broadcasts final ballots to all Clients.")
+        # Same user-id ordering the clients received with the question
+        ballots = tuple(
+            self.sessions[user_id].masked_ballot
+            for user_id in sorted(self.sessions, key=int)
         )
-        flag = asyncio.Event()
-        asyncio.create_task(self.__check_ballot_count(flag))
-        await flag.wait()
-
-        ballots = [session.masked_ballot for session in self.sessions.values()]
         send_ballots_event = SendBallotsEvent(payload={"ballots": ballots})
-        await self.__send_event(send_ballots_event, session)
+        for session in self.sessions.values():
+            session.put_event(send_ballots_event)
 
     async def _steer_message_masked_ballot(
         self, message: AbstractMessage, session: ClientSession
@@ -95,15 +111,17 @@ class SessionUpstreamHandler:
         masked_ballot = message.payload["masked_ballot"]
         masked_ballot_proof = message.payload["proof"]
         self.log.info(
-            f"Server got {masked_ballot=}, with {masked_ballot_proof=} "
-            f"from Client {session.user_id}."
+            "Server got masked_ballot=%s, with masked_ballot_proof=%s "
+            "from Client %s.",
+            masked_ballot,
+            masked_ballot_proof,
+            session.user_id,
         )
-        self.sessions[session.user_id].masked_ballot = masked_ballot
+        session.masked_ballot = masked_ballot
+        self._ballots_in += 1
         challenge = Crypto.get_zkp_challenge()
-        self.sessions[session.user_id].challenge = challenge
-        self.sessions[
-            session.user_id
-        ].masked_ballot_proof = masked_ballot_proof
+        session.challenge = challenge
+        session.masked_ballot_proof = masked_ballot_proof
         zkp_ballot_challenge_event = ZKPForBallotChallengeEvent(
             payload={"challenge": challenge}
         )
@@ -113,28 +131,46 @@ class SessionUpstreamHandler:
         self, message: AbstractMessage, session: ClientSession
     ) -> None:
         masked_ballot_proof = message.payload["proof"]
-        self.sessions[session.user_id].masked_ballot_proof.update(
-            masked_ballot_proof
-        )
+        session.masked_ballot_proof.update(masked_ballot_proof)
         self.log.info(
-            f"Server got second part of ZKP, {masked_ballot_proof=} "
-            f"from Client {session.user_id}."
+            "Server got second part of ZKP, masked_ballot_proof=%s "
+            "from Client %s.",
+            masked_ballot_proof,
+            session.user_id,
         )
-        public_keys = [s.public_key for s in self.sessions.values()]
-        session = self.sessions[session.user_id]
-
-        acceptance = Crypto.verify_ballot_zkp(
-            client_id=session.user_id,
-            public_keys=public_keys,
-            challenge=session.challenge,
-            proof=session.masked_ballot_proof,
+        # Same user-id ordering the clients received with the question
+        public_keys = self._public_keys_snapshot
+        if public_keys is None:
+            public_keys = tuple(
+                self.sessions[user_id].public_key
+                for user_id in sorted(self.sessions, key=int)
+            )
+            self._public_keys_snapshot = public_keys
+
+        # Verification is CPU-bound point arithmetic; push it off the
+        # event loop so the other sessions' I/O keeps progressing, as
+        # the connection listener does for the login proof
+        loop = asyncio.get_running_loop()
+        acceptance = await loop.run_in_executor(
+            None,
+            Crypto.verify_ballot_zkp,
+            session.user_id,
+            public_keys,
+            session.challenge,
+            session.masked_ballot_proof,
         )
-        self.sessions[session.user_id].ballot_accepted = acceptance
+        session.ballot_accepted = acceptance
         zkp_ballot_acc_event = ZKPForBallotAccEvent(
             payload={"acceptance": acceptance}
         )
         await self.__send_event(zkp_ballot_acc_event, session)
-        await self.__wait_for_everybody_vote_next_send_all_ballots(session)
+        if acceptance:
+            self._ballots_accepted += 1
+            if (
+                self._ballots_accepted >= NUM_PARTICIPANTS
+                and self._ballots_in >= NUM_PARTICIPANTS
+            ):
+                self.__broadcast_ballots()
 
     async def __send_event(
         self, event: SessionEvent, session: ClientSession
@@ -144,4 +180,4 @@ class SessionUpstreamHandler:
         The event shall be handled in the relevant session's
         downstream handler.
         """
-        await session.event_queue.put(event)
+        session.put_event(event)